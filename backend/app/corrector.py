@@ -1,202 +1,389 @@
+import copy
+import hashlib
+import os
 import re
+import string
+import sys
+import threading
+import time
+import urllib.parse
+import warnings
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+
+import httpx
 import language_tool_python
+from language_tool_python import Match
+from language_tool_python.utils import LanguageToolError
+
 from .schemas import Change
 
 # ---------------------------------------------------------------------------
 # Spelling variant dictionaries
-# Keys are US spellings, values are UK spellings.
-# To go the other way we just reverse the dict.
+# One (US, UK) pair per spelling; both lookup directions are built from it.
 # ---------------------------------------------------------------------------
 
-_US_TO_UK: dict[str, str] = {
+_PAIRS: list[tuple[str, str]] = [
     # -or / -our
-    "color": "colour",
-    "colors": "colours",
-    "colored": "coloured",
-    "coloring": "colouring",
-    "colorful": "colourful",
-    "favor": "favour",
-    "favors": "favours",
-    "favorite": "favourite",
-    "favorites": "favourites",
-    "flavor": "flavour",
-    "flavors": "flavours",
-    "honor": "honour",
-    "honors": "honours",
-    "honored": "honoured",
-    "humor": "humour",
-    "humors": "humours",
-    "labor": "labour",
-    "labors": "labours",
-    "neighbor": "neighbour",
-    "neighbors": "neighbours",
-    "neighborhood": "neighbourhood",
-    "rumor": "rumour",
-    "rumors": "rumours",
-    "savior": "saviour",
-    "valor": "valour",
-    "vigor": "vigour",
-    "behavior": "behaviour",
-    "behaviors": "behaviours",
-    "endeavor": "endeavour",
-    "endeavors": "endeavours",
+    ("color", "colour"),
+    ("colors", "colours"),
+    ("colored", "coloured"),
+    ("coloring", "colouring"),
+    ("colorful", "colourful"),
+    ("favor", "favour"),
+    ("favors", "favours"),
+    ("favorite", "favourite"),
+    ("favorites", "favourites"),
+    ("flavor", "flavour"),
+    ("flavors", "flavours"),
+    ("honor", "honour"),
+    ("honors", "honours"),
+    ("honored", "honoured"),
+    ("humor", "humour"),
+    ("humors", "humours"),
+    ("labor", "labour"),
+    ("labors", "labours"),
+    ("neighbor", "neighbour"),
+    ("neighbors", "neighbours"),
+    ("neighborhood", "neighbourhood"),
+    ("rumor", "rumour"),
+    ("rumors", "rumours"),
+    ("savior", "saviour"),
+    ("valor", "valour"),
+    ("vigor", "vigour"),
+    ("behavior", "behaviour"),
+    ("behaviors", "behaviours"),
+    ("endeavor", "endeavour"),
+    ("endeavors", "endeavours"),
     # -ize / -ise
-    "organize": "organise",
-    "organizes": "organises",
-    "organized": "organised",
-    "organizing": "organising",
-    "organization": "organisation",
-    "organizations": "organisations",
-    "recognize": "recognise",
-    "recognizes": "recognises",
-    "recognized": "recognised",
-    "recognizing": "recognising",
-    "realize": "realise",
-    "realizes": "realises",
-    "realized": "realised",
-    "realizing": "realising",
-    "apologize": "apologise",
-    "apologizes": "apologises",
-    "apologized": "apologised",
-    "apologizing": "apologising",
-    "authorize": "authorise",
-    "authorized": "authorised",
-    "capitalize": "capitalise",
-    "capitalized": "capitalised",
-    "categorize": "categorise",
-    "categorized": "categorised",
-    "centralize": "centralise",
-    "centralized": "centralised",
-    "characterize": "characterise",
-    "characterized": "characterised",
-    "customize": "customise",
-    "customized": "customised",
-    "emphasize": "emphasise",
-    "emphasized": "emphasised",
-    "finalize": "finalise",
-    "finalized": "finalised",
-    "generalize": "generalise",
-    "generalized": "generalised",
-    "initialize": "initialise",
-    "initialized": "initialised",
-    "maximize": "maximise",
-    "minimized": "minimised",
-    "minimize": "minimise",
-    "modernize": "modernise",
-    "normalize": "normalise",
-    "normalized": "normalised",
-    "optimize": "optimise",
-    "optimized": "optimised",
-    "prioritize": "prioritise",
-    "prioritized": "prioritised",
-    "specialize": "specialise",
-    "specialized": "specialised",
-    "standardize": "standardise",
-    "standardized": "standardised",
-    "summarize": "summarise",
-    "summarized": "summarised",
-    "symbolize": "symbolise",
-    "symbolized": "symbolised",
-    "utilize": "utilise",
-    "utilized": "utilised",
-    "visualize": "visualise",
-    "visualized": "visualised",
+    ("organize", "organise"),
+    ("organizes", "organises"),
+    ("organized", "organised"),
+    ("organizing", "organising"),
+    ("organization", "organisation"),
+    ("organizations", "organisations"),
+    ("recognize", "recognise"),
+    ("recognizes", "recognises"),
+    ("recognized", "recognised"),
+    ("recognizing", "recognising"),
+    ("realize", "realise"),
+    ("realizes", "realises"),
+    ("realized", "realised"),
+    ("realizing", "realising"),
+    ("apologize", "apologise"),
+    ("apologizes", "apologises"),
+    ("apologized", "apologised"),
+    ("apologizing", "apologising"),
+    ("authorize", "authorise"),
+    ("authorized", "authorised"),
+    ("capitalize", "capitalise"),
+    ("capitalized", "capitalised"),
+    ("categorize", "categorise"),
+    ("categorized", "categorised"),
+    ("centralize", "centralise"),
+    ("centralized", "centralised"),
+    ("characterize", "characterise"),
+    ("characterized", "characterised"),
+    ("customize", "customise"),
+    ("customized", "customised"),
+    ("emphasize", "emphasise"),
+    ("emphasized", "emphasised"),
+    ("finalize", "finalise"),
+    ("finalized", "finalised"),
+    ("generalize", "generalise"),
+    ("generalized", "generalised"),
+    ("initialize", "initialise"),
+    ("initialized", "initialised"),
+    ("maximize", "maximise"),
+    ("minimized", "minimised"),
+    ("minimize", "minimise"),
+    ("modernize", "modernise"),
+    ("normalize", "normalise"),
+    ("normalized", "normalised"),
+    ("optimize", "optimise"),
+    ("optimized", "optimised"),
+    ("prioritize", "prioritise"),
+    ("prioritized", "prioritised"),
+    ("specialize", "specialise"),
+    ("specialized", "specialised"),
+    ("standardize", "standardise"),
+    ("standardized", "standardised"),
+    ("summarize", "summarise"),
+    ("summarized", "summarised"),
+    ("symbolize", "symbolise"),
+    ("symbolized", "symbolised"),
+    ("utilize", "utilise"),
+    ("utilized", "utilised"),
+    ("visualize", "visualise"),
+    ("visualized", "visualised"),
     # -er / -re
-    "center": "centre",
-    "centers": "centres",
-    "centered": "centred",
-    "fiber": "fibre",
-    "fibers": "fibres",
-    "liter": "litre",
-    "liters": "litres",
-    "meter": "metre",
-    "meters": "metres",
-    "theater": "theatre",
-    "theaters": "theatres",
+    ("center", "centre"),
+    ("centers", "centres"),
+    ("centered", "centred"),
+    ("fiber", "fibre"),
+    ("fibers", "fibres"),
+    ("liter", "litre"),
+    ("liters", "litres"),
+    ("meter", "metre"),
+    ("meters", "metres"),
+    ("theater", "theatre"),
+    ("theaters", "theatres"),
     # -og / -ogue
-    "analog": "analogue",
-    "catalog": "catalogue",
-    "dialog": "dialogue",
-    "monolog": "monologue",
+    ("analog", "analogue"),
+    ("catalog", "catalogue"),
+    ("dialog", "dialogue"),
+    ("monolog", "monologue"),
     # -ense / -ence
-    "defense": "defence",
-    "offense": "offence",
-    "license": "licence",
-    "pretense": "pretence",
+    ("defense", "defence"),
+    ("offense", "offence"),
+    ("license", "licence"),
+    ("pretense", "pretence"),
     # -l- / -ll-
-    "traveling": "travelling",
-    "traveled": "travelled",
-    "traveler": "traveller",
-    "travelers": "travellers",
-    "canceled": "cancelled",
-    "canceling": "cancelling",
-    "counselor": "counsellor",
-    "counselors": "counsellors",
-    "enrollment": "enrolment",
-    "fulfillment": "fulfilment",
-    "modeling": "modelling",
-    "modeled": "modelled",
-    "signaling": "signalling",
-    "signaled": "signalled",
+    ("traveling", "travelling"),
+    ("traveled", "travelled"),
+    ("traveler", "traveller"),
+    ("travelers", "travellers"),
+    ("canceled", "cancelled"),
+    ("canceling", "cancelling"),
+    ("counselor", "counsellor"),
+    ("counselors", "counsellors"),
+    ("enrollment", "enrolment"),
+    ("fulfillment", "fulfilment"),
+    ("modeling", "modelling"),
+    ("modeled", "modelled"),
+    ("signaling", "signalling"),
+    ("signaled", "signalled"),
     # misc
-    "program": "programme",
-    "programs": "programmes",
-    "programmed": "programmed",
-    "gray": "grey",
-    "grays": "greys",
-    "tire": "tyre",
-    "tires": "tyres",
-    "airplane": "aeroplane",
-    "airplanes": "aeroplanes",
-    "artifact": "artefact",
-    "artifacts": "artefacts",
-    "check": "cheque",
-    "checks": "cheques",
-    "curb": "kerb",
-    "curbs": "kerbs",
-    "draft": "draught",
-    "drafts": "draughts",
-    "jewelry": "jewellery",
-    "pajamas": "pyjamas",
-    "plow": "plough",
-    "plows": "ploughs",
-    "skeptic": "sceptic",
-    "skeptical": "sceptical",
-    "skepticism": "scepticism",
+    ("program", "programme"),
+    ("programs", "programmes"),
+    ("programmed", "programmed"),
+    ("gray", "grey"),
+    ("grays", "greys"),
+    ("tire", "tyre"),
+    ("tires", "tyres"),
+    ("airplane", "aeroplane"),
+    ("airplanes", "aeroplanes"),
+    ("artifact", "artefact"),
+    ("artifacts", "artefacts"),
+    ("check", "cheque"),
+    ("checks", "cheques"),
+    ("curb", "kerb"),
+    ("curbs", "kerbs"),
+    ("draft", "draught"),
+    ("drafts", "draughts"),
+    ("jewelry", "jewellery"),
+    ("pajamas", "pyjamas"),
+    ("plow", "plough"),
+    ("plows", "ploughs"),
+    ("skeptic", "sceptic"),
+    ("skeptical", "sceptical"),
+    ("skepticism", "scepticism"),
+]
+
+# Intern every word so equal keys are usually the same object, and so the
+# two dicts share their strings
+_PAIRS = [(sys.intern(us), sys.intern(uk)) for us, uk in _PAIRS]
+
+_US_TO_UK: dict[str, str] = {}
+_UK_TO_US: dict[str, str] = {}
+for _us, _uk in _PAIRS:
+    _US_TO_UK.setdefault(_us, _uk)
+    # The first pair wins if two US spellings share a UK one
+    if _UK_TO_US.setdefault(_uk, _us) != _us:
+        warnings.warn(
+            f"UK spelling {_uk!r} maps back from both "
+            f"{_UK_TO_US[_uk]!r} and {_us!r}; keeping {_UK_TO_US[_uk]!r}",
+            stacklevel=1,
+        )
+del _us, _uk
+
+
+def _trie_regex(node: dict) -> str:
+    """Regex source for a prefix trie built by ``_compile_words``."""
+    branches = [
+        re.escape(ch) + _trie_regex(child) for ch, child in sorted(node.items()) if ch
+    ]
+    if not branches:
+        return ""
+    if len(branches) == 1 and "" not in node:
+        return branches[0]
+    group = "(?:" + "|".join(branches) + ")"
+    # An empty key marks the end of a word, so the rest is optional
+    return group + "?" if "" in node else group
+
+
+def _compile_words(words: Iterable[str]) -> re.Pattern[str]:
+    """Match any of *words* as a whole run of letters in lowercased text.
+
+    The words are factored into a prefix trie ("colo(?:r(?:s|ed|...)?|...)")
+    so the engine walks each candidate once instead of retrying every word.
+    """
+    trie: dict = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+    # The first-letter lookahead lets most positions fail before the trie
+    initials = "".join(ch for ch in sorted(trie) if ch)
+    return re.compile(rf"(?<![a-z])(?=[{initials}]){_trie_regex(trie)}(?![a-z])")
+
+
+# One pattern per direction finds every convertible word in a single scan.
+# The patterns are the trie; the dicts are only consulted on a match.
+_US_RE = _compile_words(_US_TO_UK)
+_UK_RE = _compile_words(_UK_TO_US)
+
+# Target variant -> (source-to-target spellings, pattern over the sources)
+_VARIANT_TABLES: dict[str, tuple[dict[str, str], re.Pattern[str]]] = {
+    "uk": (_US_TO_UK, _US_RE),
+    "us": (_UK_TO_US, _UK_RE),
 }
 
-_UK_TO_US: dict[str, str] = {v: k for k, v in _US_TO_UK.items()}
+# Sentence boundaries for chunked correction; the whitespace is captured so
+# the chunks join back into the original layout
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])(\s+)")
+
+# Joins texts batched into a single LanguageTool check; rare enough that no
+# real input contains it, and the blank lines keep LT from reading across it.
+_BATCH_SEPARATOR = "\n\n\u00a7\u00a7\u00a7\n\n"
+
+# Texts longer than this are split at sentence boundaries and the pieces are
+# checked concurrently, one LanguageTool server thread each
+_PARALLEL_CHECK_CHARS = 4000
+_CHECK_THREADS = 8
+_check_pool = ThreadPoolExecutor(max_workers=_CHECK_THREADS)
 
-# Build fast lookup sets for each direction
-_US_WORDS = set(_US_TO_UK.keys())
-_UK_WORDS = set(_UK_TO_US.keys())
+# Characters outside the BMP, which LanguageTool counts as two UTF-16 units
+_ASTRAL_RE = re.compile("[\U00010000-\U0010ffff]")
 
-# Regex to split text into words and non-words while preserving structure
-_TOKEN_RE = re.compile(r"([A-Za-z]+|[^A-Za-z]+)")
+# Lowercases ASCII letters only, so offsets into the result match the input.
+# A byte table: A-Z never occur inside a multi-byte UTF-8 sequence.
+_ASCII_LOWER = bytes.maketrans(
+    string.ascii_uppercase.encode(), string.ascii_lowercase.encode()
+)
 
 # URLs and common patterns to leave untouched
 _URL_RE = re.compile(
     r"https?://[^\s]+|www\.[^\s]+|[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
 )
+# Every _URL_RE match contains one of these, so a substring check can rule
+# out URLs without running the regex at each position
+_URL_MARKERS = ("://", "www.", "@")
+
+
+# Match.__init__ reads and writes class-level state; see _matches_from_json
+_match_init_lock = threading.Lock()
+
+
+def _matches_from_json(matches: list[dict], text: str) -> list[Match]:
+    """``Match`` objects for a ``/v2/check`` result, with code point offsets.
+
+    ``Match`` itself converts LanguageTool's UTF-16 offsets through
+    class-level state that concurrent checks overwrite, so the conversion is
+    done here per call.  ``Match`` gets no text to convert against, and is
+    built under a lock so that state is never seen half-written.
+    """
+    # UTF-16 offset of each non-BMP character in text
+    astral = [m.start() + i for i, m in enumerate(_ASTRAL_RE.finditer(text))]
+    for match in matches:
+        if astral:
+            start = match["offset"]
+            end = start + match["length"]
+            match["offset"] = start - bisect_left(astral, start)
+            match["length"] = end - bisect_left(astral, end) - match["offset"]
+    with _match_init_lock:
+        return [Match(match, "") for match in matches]
+
+
+class _RemoteLanguageTool:
+    """Client for a LanguageTool server over pooled keep-alive connections.
+
+    Stands in for ``language_tool_python.LanguageTool``, which opens a new
+    connection for every check and builds its matches thread-unsafely.
+    """
+
+    def __init__(
+        self, url: str, language: str, transport: httpx.BaseTransport | None = None
+    ) -> None:
+        self._language = language
+        self._client = httpx.Client(
+            base_url=url,
+            timeout=300,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            transport=transport,
+        )
+
+    def wait_ready(self, timeout: float = 120.0, interval: float = 1.0) -> None:
+        """Block until the server answers, e.g. while its JVM is still starting."""
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                self._client.get("/v2/languages").raise_for_status()
+                return
+            except httpx.HTTPError as exc:
+                if time.monotonic() >= deadline:
+                    raise LanguageToolError(
+                        f"{self._client.base_url} not ready after {timeout:.0f}s: {exc}"
+                    ) from exc
+            time.sleep(interval)
+
+    def check(self, text: str) -> list[Match]:
+        try:
+            response = self._client.post(
+                "/v2/check", data={"language": self._language, "text": text}
+            )
+            response.raise_for_status()
+        except httpx.HTTPError as exc:
+            raise LanguageToolError(f"{self._client.base_url}: {exc}") from exc
+        return _matches_from_json(response.json()["matches"], text)
 
 
 class TextCorrector:
-    """Grammar + variant spelling corrector."""
+    """Grammar + variant spelling corrector.
+
+    Checks go to the LanguageTool server at ``$LANGUAGETOOL_URL`` when it is
+    set, so several workers can share one JVM; otherwise a local server is
+    started and checked over the same client.
+    """
 
     def __init__(self) -> None:
-        self._tool = language_tool_python.LanguageTool("en-US")
+        remote_url = os.getenv("LANGUAGETOOL_URL")
+        if remote_url:
+            self._tool = _RemoteLanguageTool(remote_url, "en-US")
+            return
+        # Kept referenced: the library stops the JVM when this is collected
+        self._server = language_tool_python.LanguageTool(
+            "en-US",
+            config={
+                "cacheSize": 10000,
+                "pipelineCaching": True,
+                "maxCheckThreads": _CHECK_THREADS,
+            },
+        )
+        server_root = urllib.parse.urljoin(self._server._url, "/")
+        self._tool = _RemoteLanguageTool(server_root, "en-US")
 
     # ------------------------------------------------------------------
     # Public
     # ------------------------------------------------------------------
 
+    def warm_up(self) -> None:
+        """Prime LanguageTool's analysers so the first request is not slow."""
+        self._tool.wait_ready()
+        self._tool.check("Warm up text, please.")
+        self._tool.check("warm up text, please!")
+
     def correct(
-        self, text: str, variant: str
+        self, text: str, variant: str, matches: Sequence[Match] | None = None
     ) -> tuple[str, list[Change]]:
         changes: list[Change] = []
 
         # Step 1 - Grammar / punctuation fixes via LanguageTool
-        grammar_fixed, grammar_changes = self._fix_grammar(text)
+        grammar_fixed, grammar_changes = self._fix_grammar(text, matches)
         changes.extend(grammar_changes)
 
         # Step 2 - Variant spelling conversion
@@ -207,21 +394,44 @@ class TextCorrector:
 
         return variant_fixed, changes
 
+    def correct_chunks(
+        self, text: str, variant: str
+    ) -> Iterator[tuple[str, list[Change]]]:
+        """Correct *text* one sentence at a time.
+
+        Each chunk's corrected text carries the whitespace that followed the
+        sentence, so joining the chunks gives the whole corrected document.
+        """
+        parts = _SENTENCE_SPLIT_RE.split(text)
+        for i in range(0, len(parts), 2):
+            sentence = parts[i]
+            # Only the part after trailing whitespace can be empty
+            if not sentence:
+                continue
+            trailing = parts[i + 1] if i + 1 < len(parts) else ""
+            corrected, changes = self.correct(sentence, variant)
+            yield corrected + trailing, changes
+
     # ------------------------------------------------------------------
     # Grammar
     # ------------------------------------------------------------------
 
-    def _fix_grammar(self, text: str) -> tuple[str, list[Change]]:
-        matches = self._tool.check(text)
+    def _fix_grammar(
+        self, text: str, matches: Sequence[Match] | None = None
+    ) -> tuple[str, list[Change]]:
+        if matches is None:
+            matches = _check(text)
         changes: list[Change] = []
 
-        # Apply fixes in reverse offset order so positions stay valid
-        corrected = text
-        for match in reversed(matches):
-            if not match.replacements:
+        # Copy the text between fixes once, left to right
+        result_parts: list[str] = []
+        pos = 0
+        for match in sorted(matches, key=attrgetter("offset")):
+            if not match.replacements or match.offset < pos:
                 continue
             replacement = match.replacements[0]
-            original = corrected[match.offset : match.offset + match.errorLength]
+            end = match.offset + match.errorLength
+            original = text[match.offset : end]
             if original == replacement:
                 continue
 
@@ -229,15 +439,12 @@ class TextCorrector:
             changes.append(
                 Change(type=change_type, original=original, replacement=replacement)
             )
-            corrected = (
-                corrected[: match.offset]
-                + replacement
-                + corrected[match.offset + match.errorLength :]
-            )
+            result_parts.append(text[pos : match.offset])
+            result_parts.append(replacement)
+            pos = end
 
-        # Reverse so changes appear in document order
-        changes.reverse()
-        return corrected, changes
+        result_parts.append(text[pos:])
+        return "".join(result_parts), changes
 
     @staticmethod
     def _classify_match(match) -> str:  # type: ignore[no-untyped-def]
@@ -256,55 +463,66 @@ class TextCorrector:
     def _convert_variant(
         self, text: str, variant: str
     ) -> tuple[str, list[Change]]:
-        if variant == "uk":
-            mapping = _US_TO_UK
-            source_words = _US_WORDS
-        else:
-            mapping = _UK_TO_US
-            source_words = _UK_WORDS
+        mapping, pattern = _VARIANT_TABLES[variant]
+
+        # Scan a lowercased copy so dictionary lookups need no per-word lower().
+        # Going through bytes avoids str.translate's per-character slow path
+        # on non-ASCII text.
+        text_lower = (
+            text.encode("utf-8", "surrogatepass")
+            .translate(_ASCII_LOWER)
+            .decode("utf-8", "surrogatepass")
+        )
+
+        # Most texts contain no word to convert, so look for the first one
+        # before doing any URL or output work
+        first = pattern.search(text_lower)
+        if first is None:
+            return text, []
 
         # Find URL spans to skip
-        url_spans: list[tuple[int, int]] = []
-        for m in _URL_RE.finditer(text):
-            url_spans.append((m.start(), m.end()))
+        url_starts: list[int] = []
+        url_ends: list[int] = []
+        if any(marker in text for marker in _URL_MARKERS):
+            for m in _URL_RE.finditer(text):
+                url_starts.append(m.start())
+                url_ends.append(m.end())
 
         changes: list[Change] = []
         result_parts: list[str] = []
         pos = 0
 
-        for token_match in _TOKEN_RE.finditer(text):
-            token = token_match.group()
-            start = token_match.start()
+        for word_match in pattern.finditer(text_lower, first.start()):
+            start, end = word_match.span()
 
-            # Skip tokens inside URLs
-            in_url = any(s <= start < e for s, e in url_spans)
-            if in_url or not token.isalpha():
-                result_parts.append(token)
+            # Skip words inside URLs
+            idx = bisect_right(url_starts, start) - 1
+            if idx >= 0 and start < url_ends[idx]:
                 continue
 
-            lower = token.lower()
-            if lower in source_words:
-                replacement = mapping[lower]
-                # Preserve original casing
-                replacement = self._match_case(token, replacement)
-                if replacement != token:
-                    changes.append(
-                        Change(type="spelling", original=token, replacement=replacement)
-                    )
-                    result_parts.append(replacement)
-                    continue
-
-            result_parts.append(token)
-
+            token = text[start:end]
+            # Preserve original casing
+            replacement = self._match_case(token, mapping[word_match.group()])
+            if replacement != token:
+                changes.append(
+                    Change(type="spelling", original=token, replacement=replacement)
+                )
+                result_parts.append(text[pos:start])
+                result_parts.append(replacement)
+                pos = end
+
+        result_parts.append(text[pos:])
         return "".join(result_parts), changes
 
     @staticmethod
     def _match_case(original: str, replacement: str) -> str:
+        # Words come from the ASCII-only scan, so a range check on the first
+        # letter settles the common all-lowercase case without a method call
+        if not "A" <= original[0] <= "Z":
+            return replacement
         if original.isupper():
             return replacement.upper()
-        if original[0].isupper():
-            return replacement[0].upper() + replacement[1:]
-        return replacement
+        return replacement[0].upper() + replacement[1:]
 
 
 # Module-level singleton (created lazily on first import in main)
@@ -316,3 +534,154 @@ def get_corrector() -> TextCorrector:
     if _corrector is None:
         _corrector = TextCorrector()
     return _corrector
+
+
+class _MatchCache:
+    """Least-recently-used cache of LanguageTool matches, keyed by text digest.
+
+    Unlike ``functools.lru_cache`` it can be read and filled separately, so
+    batched checks share entries with single ones.  Keys are digests rather
+    than the texts themselves, and texts over ``max_text_chars`` are not
+    cached, so memory stays bounded whatever the request sizes.
+    """
+
+    def __init__(self, maxsize: int, max_text_chars: int) -> None:
+        self._maxsize = maxsize
+        self._max_text_chars = max_text_chars
+        self._entries: OrderedDict[bytes, tuple[Match, ...]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(text: str) -> bytes:
+        return hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+
+    def get(self, text: str) -> tuple[Match, ...] | None:
+        if len(text) > self._max_text_chars:
+            return None
+        key = self._key(text)
+        with self._lock:
+            matches = self._entries.get(key)
+            if matches is not None:
+                self._entries.move_to_end(key)
+            return matches
+
+    def put(self, text: str, matches: tuple[Match, ...]) -> None:
+        if len(text) > self._max_text_chars:
+            return
+        key = self._key(text)
+        with self._lock:
+            self._entries[key] = matches
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_match_cache = _MatchCache(maxsize=1024, max_text_chars=4 * _PARALLEL_CHECK_CHARS)
+
+
+def _check(text: str) -> tuple[Match, ...]:
+    """LanguageTool matches for *text*, memoised to skip repeat JVM round-trips."""
+    matches = _match_cache.get(text)
+    if matches is None:
+        matches = _check_uncached(text)
+        _match_cache.put(text, matches)
+    return matches
+
+
+def _check_uncached(text: str) -> tuple[Match, ...]:
+    tool = get_corrector()._tool
+    if len(text) <= _PARALLEL_CHECK_CHARS:
+        return tuple(tool.check(text))
+
+    pieces = _split_for_check(text)
+    results = _check_pool.map(tool.check, [piece for _, piece in pieces])
+    return tuple(
+        _shifted(match, start)
+        for (start, _), matches in zip(pieces, results)
+        for match in matches
+    )
+
+
+def _split_for_check(text: str) -> list[tuple[int, str]]:
+    """Cut *text* at sentence ends into ``(offset, piece)`` parts for checking."""
+    pieces: list[tuple[int, str]] = []
+    start = 0
+    for m in _SENTENCE_SPLIT_RE.finditer(text):
+        if m.end() - start >= _PARALLEL_CHECK_CHARS:
+            pieces.append((start, text[start : m.end()]))
+            start = m.end()
+    if start < len(text):
+        pieces.append((start, text[start:]))
+    return pieces
+
+
+def _shifted(match: Match, offset: int) -> Match:
+    """Copy of *match* with its offset moved by *offset*."""
+    local = copy.copy(match)
+    local.offset = match.offset + offset
+    return local
+
+
+def check_batch(texts: Sequence[str]) -> list[tuple[Match, ...]]:
+    """Check several texts, sharing LanguageTool calls between short ones.
+
+    Cached texts are answered from the cache, and texts too long to join go
+    through ``_check`` and its parallel split.  The rest are joined with a
+    separator into calls of at most ``_PARALLEL_CHECK_CHARS`` characters,
+    their matches are split back out by offset (dropping any that straddle
+    a separator) and cached.
+
+    LanguageTool's few text-level rules, such as unpaired quotes or
+    brackets, can still see the other texts in a joined call, so a result
+    may occasionally depend on what it was batched with.
+    """
+    results: dict[str, tuple[Match, ...]] = {}
+    groups: list[list[str]] = []
+    group_size = _PARALLEL_CHECK_CHARS
+    for text in dict.fromkeys(texts):
+        cached = _match_cache.get(text)
+        if cached is not None:
+            results[text] = cached
+            continue
+        if len(text) > _PARALLEL_CHECK_CHARS:
+            results[text] = _check(text)
+            continue
+        group_size += len(_BATCH_SEPARATOR) + len(text)
+        if group_size > _PARALLEL_CHECK_CHARS:
+            groups.append([])
+            group_size = len(text)
+        groups[-1].append(text)
+
+    for group in groups:
+        if len(group) == 1:
+            results[group[0]] = _check(group[0])
+            continue
+        for text, matches in zip(group, _check_joined(group)):
+            _match_cache.put(text, matches)
+            results[text] = matches
+
+    return [results[text] for text in texts]
+
+
+def _check_joined(texts: Sequence[str]) -> list[tuple[Match, ...]]:
+    """Check *texts* in one LanguageTool call and split the matches back out."""
+    starts: list[int] = []
+    pos = 0
+    for text in texts:
+        starts.append(pos)
+        pos += len(text) + len(_BATCH_SEPARATOR)
+
+    results: list[list[Match]] = [[] for _ in texts]
+    for match in get_corrector()._tool.check(_BATCH_SEPARATOR.join(texts)):
+        idx = bisect_right(starts, match.offset) - 1
+        if match.offset - starts[idx] + match.errorLength > len(texts[idx]):
+            continue
+        results[idx].append(_shifted(match, -starts[idx]))
+
+    return [tuple(r) for r in results]
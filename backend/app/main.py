@@ -1,23 +1,108 @@
-from fastapi import FastAPI
+import asyncio
+import os
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import asynccontextmanager
+
+import msgspec
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import ValidationError
+from fastapi.responses import Response, StreamingResponse
+from language_tool_python import Match
+from language_tool_python.utils import LanguageToolError
+
+from .schemas import (
+    CorrectionChunk,
+    CorrectionRequest,
+    CorrectionResponse,
+    ErrorDetail,
+    ErrorResponse,
+    StreamError,
+)
+from .corrector import check_batch, get_corrector
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Start the LanguageTool JVM before serving, instead of on first request
+    corrector = await run_in_threadpool(get_corrector)
+    await run_in_threadpool(corrector.warm_up)
+    yield
 
-from .schemas import CorrectionRequest, CorrectionResponse
-from .corrector import get_corrector
 
 app = FastAPI(
     title="Text Corrector API",
     description="Corrects grammar and converts text between British and American English.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# The browser frontend is served from another origin and needs CORS;
+# same-origin or internal deployments can drop it with ENABLE_CORS=0
+if os.getenv("ENABLE_CORS", "1") == "1":
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+
+
+class BatchChecker:
+    """Coalesce concurrent LanguageTool checks into one call.
+
+    Requests arriving within ``window`` seconds of each other (up to
+    ``max_batch`` of them) share a single LanguageTool round-trip; identical
+    texts in a batch are only checked once.
+    """
+
+    def __init__(self, window: float = 0.01, max_batch: int = 16) -> None:
+        self._window = window
+        self._max_batch = max_batch
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        # The loop only holds weak references to tasks
+        self._tasks: set[asyncio.Task] = set()
+
+    async def check(self, text: str) -> Sequence[Match]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((text, future))
+        if len(self._pending) >= self._max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._run(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _run(batch: list[tuple[str, asyncio.Future]]) -> None:
+        texts = list(dict.fromkeys(text for text, _ in batch))
+        try:
+            results = await run_in_threadpool(check_batch, texts)
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        by_text = dict(zip(texts, results))
+        for text, future in batch:
+            if not future.done():
+                future.set_result(by_text[text])
+
+
+_batcher = BatchChecker()
 
 
 @app.get("/health")
@@ -25,12 +110,118 @@ def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
-@app.post("/correct", response_model=CorrectionResponse)
-def correct_text(req: CorrectionRequest) -> CorrectionResponse:
+# The handlers decode the body themselves, so FastAPI cannot infer their
+# schemas; publish the msgspec ones in the OpenAPI document instead
+(
+    _REQUEST_SCHEMA,
+    _RESPONSE_SCHEMA,
+    _CHUNK_SCHEMA,
+    _STREAM_ERROR_SCHEMA,
+    _ERROR_SCHEMA,
+), _SCHEMA_COMPONENTS = msgspec.json.schema_components(
+    [
+        CorrectionRequest,
+        CorrectionResponse,
+        CorrectionChunk,
+        StreamError,
+        ErrorResponse,
+    ],
+    ref_template="#/components/schemas/{name}",
+)
+_REQUEST_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": _REQUEST_SCHEMA}},
+    }
+}
+_VALIDATION_ERROR = {
+    "description": "Validation Error",
+    "content": {"application/json": {"schema": _ERROR_SCHEMA}},
+}
+
+_base_openapi = app.openapi
+
+
+def _openapi() -> dict:
+    if app.openapi_schema is None:
+        schema = _base_openapi()
+        components = schema.setdefault("components", {})
+        components.setdefault("schemas", {}).update(_SCHEMA_COMPONENTS)
+    return app.openapi_schema
+
+
+app.openapi = _openapi  # type: ignore[method-assign]
+
+
+async def _decode_request(request: Request) -> CorrectionRequest:
+    try:
+        return msgspec.json.decode(await request.body(), type=CorrectionRequest)
+    except msgspec.DecodeError as exc:
+        # Same {"detail": [{"type", "loc", "msg"}]} shape FastAPI gives
+        error_type = (
+            "value_error" if isinstance(exc, msgspec.ValidationError) else "json_invalid"
+        )
+        detail = ErrorDetail(type=error_type, loc=["body"], msg=str(exc))
+        raise HTTPException(
+            status_code=422, detail=[msgspec.to_builtins(detail)]
+        ) from exc
+
+
+@app.post(
+    "/correct",
+    openapi_extra=_REQUEST_BODY,
+    responses={
+        200: {"content": {"application/json": {"schema": _RESPONSE_SCHEMA}}},
+        422: _VALIDATION_ERROR,
+    },
+)
+async def correct_text(request: Request) -> Response:
+    req = await _decode_request(request)
+    matches = await _batcher.check(req.text)
     corrector = get_corrector()
-    corrected, changes = corrector.correct(req.text, req.variant)
-    return CorrectionResponse(
+    # The splice and variant scan are CPU-bound; keep them off the event loop
+    corrected, changes = await run_in_threadpool(
+        corrector.correct, req.text, req.variant, matches
+    )
+    resp = CorrectionResponse(
         corrected=corrected,
         variant=req.variant,
         changes=changes,
     )
+    return Response(msgspec.json.encode(resp), media_type="application/json")
+
+
+@app.post(
+    "/correct/stream",
+    response_class=StreamingResponse,
+    openapi_extra=_REQUEST_BODY,
+    responses={
+        200: {
+            "description": (
+                "One JSON object per line, one line per sentence; a failed"
+                " stream ends with an error line"
+            ),
+            "content": {
+                "application/x-ndjson": {
+                    "schema": {"anyOf": [_CHUNK_SCHEMA, _STREAM_ERROR_SCHEMA]}
+                }
+            },
+        },
+        422: _VALIDATION_ERROR,
+    },
+)
+async def correct_text_stream(request: Request) -> StreamingResponse:
+    req = await _decode_request(request)
+
+    def lines() -> Iterator[bytes]:
+        corrector = get_corrector()
+        try:
+            for corrected, changes in corrector.correct_chunks(req.text, req.variant):
+                chunk = CorrectionChunk(corrected=corrected, changes=changes)
+                yield msgspec.json.encode(chunk) + b"\n"
+        except LanguageToolError as exc:
+            # The 200 status is already sent, so say in the body that the
+            # stream stopped short rather than ending as if it were complete
+            yield msgspec.json.encode(StreamError(error=str(exc))) + b"\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
@@ -1,26 +1,46 @@
-from pydantic import BaseModel, field_validator
+import msgspec
 from typing import Literal
 
 
-class CorrectionRequest(BaseModel):
+class CorrectionRequest(msgspec.Struct):
     text: str
     variant: Literal["uk", "us"]
 
-    @field_validator("text")
-    @classmethod
-    def text_must_not_be_empty(cls, v: str) -> str:
-        if not v.strip():
+    def __post_init__(self) -> None:
+        # Raised during decoding, where msgspec reports it as a ValidationError
+        if not self.text.strip():
             raise ValueError("Input text must not be empty.")
-        return v
 
 
-class Change(BaseModel):
+# Only holds strings, so it can never be part of a reference cycle; opting
+# out of GC tracking makes the many per-request instances cheaper to create
+class Change(msgspec.Struct, gc=False):
     type: Literal["spelling", "grammar", "punctuation"]
     original: str
     replacement: str
 
 
-class CorrectionResponse(BaseModel):
+class CorrectionResponse(msgspec.Struct):
     corrected: str
     variant: Literal["uk", "us"]
     changes: list[Change]
+
+
+class CorrectionChunk(msgspec.Struct):
+    corrected: str
+    changes: list[Change]
+
+
+# Last line of a /correct/stream body that failed part-way through
+class StreamError(msgspec.Struct):
+    error: str
+
+
+class ErrorDetail(msgspec.Struct):
+    type: str
+    loc: list[str]
+    msg: str
+
+
+class ErrorResponse(msgspec.Struct):
+    detail: list[ErrorDetail]
@@ -0,0 +1,248 @@
+import asyncio
+import json
+import re
+
+import pytest
+from fastapi.testclient import TestClient
+from language_tool_python import Match
+from language_tool_python.utils import LanguageToolError
+
+from app import corrector
+from app.corrector import (
+    TextCorrector,
+    _BATCH_SEPARATOR,
+    _PARALLEL_CHECK_CHARS,
+    _matches_from_json,
+    check_batch,
+)
+from app.main import BatchChecker, app
+
+# "teh" is flagged wherever it appears; a word followed by the batch
+# separator is flagged too, which only happens when texts are joined
+_STUB_RULE_RE = re.compile(r"teh|\w+\s+§+")
+
+
+class StubTool:
+    """Stands in for LanguageTool; offsets are UTF-16 units, like the server's."""
+
+    def __init__(self, fail: bool = False, fail_after: int | None = None) -> None:
+        self.fail = fail
+        self.fail_after = fail_after
+        self.calls: list[str] = []
+
+    def check(self, text: str) -> list[Match]:
+        self.calls.append(text)
+        past_limit = self.fail_after is not None and len(self.calls) > self.fail_after
+        if self.fail or past_limit:
+            raise LanguageToolError("server unavailable")
+        return _matches_from_json(
+            [_lt_json(text, m.start(), m.end()) for m in _STUB_RULE_RE.finditer(text)],
+            text,
+        )
+
+
+def _utf16(text: str, index: int) -> int:
+    return index + sum(1 for ch in text[:index] if ord(ch) > 0xFFFF)
+
+
+def _lt_json(text: str, start: int, end: int) -> dict:
+    """One entry of a /v2/check response's "matches" list."""
+    offset = _utf16(text, start)
+    length = _utf16(text, end) - offset
+    return {
+        "message": "Possible typo.",
+        "replacements": [{"value": "the"}],
+        "offset": offset,
+        "length": length,
+        "context": {"text": text, "offset": offset, "length": length},
+        "rule": {
+            "id": "MORFOLOGIK_RULE_EN_US",
+            "issueType": "misspelling",
+            "category": {"id": "TYPOS"},
+        },
+    }
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    tool = StubTool()
+    stub_corrector = TextCorrector.__new__(TextCorrector)
+    stub_corrector._tool = tool
+    monkeypatch.setattr(corrector, "_corrector", stub_corrector)
+    corrector._match_cache.clear()
+    yield tool
+    corrector._match_cache.clear()
+
+
+def _flagged(text: str, matches) -> list[str]:
+    return [text[m.offset : m.offset + m.errorLength] for m in matches]
+
+
+# ------------------------------------------------------------------ #
+# 1. check_batch
+# ------------------------------------------------------------------ #
+
+
+class TestCheckBatch:
+    def test_offsets_are_per_text(self, stub):
+        texts = ["teh cat sat", "a dog and teh"]
+        results = check_batch(texts)
+        assert stub.calls == [_BATCH_SEPARATOR.join(texts)]
+        assert [m.offset for m in results[0]] == [0]
+        assert [m.offset for m in results[1]] == [10]
+        for text, matches in zip(texts, results):
+            assert _flagged(text, matches) == ["teh"]
+
+    def test_emoji_offsets(self, stub):
+        texts = ["\U0001f600\U0001f600 teh", "\U0001f389 x teh \U0001f389 teh"]
+        results = check_batch(texts)
+        assert len(stub.calls) == 1
+        assert _flagged(texts[0], results[0]) == ["teh"]
+        assert _flagged(texts[1], results[1]) == ["teh", "teh"]
+
+    def test_match_across_separator_is_dropped(self, stub):
+        texts = ["I saw teh end", "next one"]
+        results = check_batch(texts)
+        # The stub flags "end" + separator in the joined text
+        assert len(stub.check(stub.calls[0])) == 2
+        assert _flagged(texts[0], results[0]) == ["teh"]
+        assert results[1] == ()
+
+    def test_duplicate_texts_checked_once(self, stub):
+        results = check_batch(["teh a", "teh a", "b teh"])
+        assert stub.calls == [_BATCH_SEPARATOR.join(["teh a", "b teh"])]
+        assert results[0] is results[1]
+
+    def test_results_are_cached(self, stub):
+        first = check_batch(["teh a", "b teh"])
+        second = check_batch(["b teh", "teh a"])
+        assert len(stub.calls) == 1
+        assert second == [first[1], first[0]]
+        assert corrector._check("teh a") is first[0]
+
+    def test_very_long_text_is_not_cached(self, stub):
+        long_text = "This is teh sentence. " * 1000
+        corrector._check(long_text)
+        calls = len(stub.calls)
+        corrector._check(long_text)
+        assert len(stub.calls) == 2 * calls
+
+    def test_cache_does_not_keep_texts(self, stub):
+        text = "teh a"
+        corrector._check(text)
+        assert corrector._match_cache.get(text) is not None
+        assert text not in corrector._match_cache._entries
+
+    def test_long_text_is_not_joined(self, stub):
+        long_text = "This is teh sentence. " * 200
+        check_batch(["teh a", long_text, "b teh"])
+        assert _BATCH_SEPARATOR.join(["teh a", "b teh"]) in stub.calls
+        assert all("sentence" not in c for c in stub.calls if _BATCH_SEPARATOR in c)
+
+
+# ------------------------------------------------------------------ #
+# 2. BatchChecker
+# ------------------------------------------------------------------ #
+
+
+class TestBatchChecker:
+    def test_concurrent_checks_share_calls(self, stub):
+        texts = [f"teh {i % 7}" for i in range(20)]
+
+        async def run():
+            batcher = BatchChecker()
+            return await asyncio.gather(*(batcher.check(t) for t in texts))
+
+        results = asyncio.run(run())
+        assert len(stub.calls) <= 2
+        for text, matches in zip(texts, results):
+            assert _flagged(text, matches) == ["teh"]
+
+    def test_running_batches_are_referenced(self, stub):
+        batcher = BatchChecker()
+
+        async def run():
+            waiter = asyncio.ensure_future(batcher.check("teh a"))
+            await asyncio.sleep(0)
+            batcher._flush()
+            assert len(batcher._tasks) == 1
+            return await waiter
+
+        assert _flagged("teh a", asyncio.run(run())) == ["teh"]
+        assert not batcher._tasks
+
+    def test_error_reaches_every_waiter(self, stub):
+        stub.fail = True
+
+        async def run():
+            batcher = BatchChecker()
+            return await asyncio.gather(
+                *(batcher.check(t) for t in ["teh a", "teh b", "teh a"]),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(run())
+        assert len(stub.calls) == 1
+        assert all(isinstance(r, LanguageToolError) for r in results)
+
+
+# ------------------------------------------------------------------ #
+# 3. Long texts checked in pieces
+# ------------------------------------------------------------------ #
+
+
+class TestSplitCheck:
+    @pytest.mark.parametrize(
+        "sentence",
+        ["This is teh sentence, teh end. ", "\U0001f600 This is teh \U0001f389 line. "],
+    )
+    def test_split_matches_equal_single_check(self, stub, sentence):
+        text = sentence * 300
+        assert len(text) > _PARALLEL_CHECK_CHARS
+
+        merged = corrector._check(text)
+        assert len(stub.calls) > 1
+        whole = StubTool().check(text)
+        assert [(m.offset, m.errorLength) for m in merged] == [
+            (m.offset, m.errorLength) for m in whole
+        ]
+        assert set(_flagged(text, merged)) == {"teh"}
+
+
+# ------------------------------------------------------------------ #
+# 4. UTF-16 offsets
+# ------------------------------------------------------------------ #
+
+
+class TestMatchOffsets:
+    def test_span_covering_emoji(self):
+        text = "\U0001f600 a \U0001f389\U0001f389 b \U0001f600"
+        start, end = text.index("a"), text.index("b") + 1
+        (match,) = _matches_from_json([_lt_json(text, start, end)], text)
+        assert (match.offset, match.errorLength) == (start, end - start)
+
+    def test_offsets_ignore_shared_match_state(self, monkeypatch):
+        text = "\U0001f600\U0001f600 x teh"
+        # As another thread's check of the same text might leave it
+        monkeypatch.setattr(Match, "PREVIOUS_MATCHES_TEXT", text)
+        monkeypatch.setattr(Match, "FOUR_BYTES_POSITIONS", [])
+        assert _flagged(text, StubTool().check(text)) == ["teh"]
+
+
+# ------------------------------------------------------------------ #
+# 5. Streaming failures
+# ------------------------------------------------------------------ #
+
+
+class TestStreamFailure:
+    def test_failure_mid_stream_ends_with_error_line(self, stub):
+        stub.fail_after = 1
+        text = "Teh first one. Teh second one. Teh third one."
+        resp = TestClient(app).post(
+            "/correct/stream", json={"text": text, "variant": "us"}
+        )
+        assert resp.status_code == 200
+        lines = [json.loads(line) for line in resp.text.splitlines()]
+        assert len(lines) == 2
+        assert "corrected" in lines[0]
+        assert lines[-1] == {"error": "server unavailable"}
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
@@ -106,12 +108,18 @@ class TestPunctuation:
 class TestEmptyInput:
     def test_empty_string(self):
         status, data = _post("", "us")
-        assert status == 422  # Pydantic validation error
+        assert status == 422  # validation error
 
     def test_whitespace_only(self):
         status, data = _post("   ", "us")
         assert status == 422
 
+    def test_error_detail_shape(self):
+        status, data = _post("", "us")
+        assert status == 422
+        assert data["detail"][0]["msg"] == "Input text must not be empty."
+        assert data["detail"][0]["loc"] == ["body"]
+
 
 # ------------------------------------------------------------------ #
 # 6. Very long input
@@ -159,3 +167,43 @@ class TestChanges:
         spelling_changes = [c for c in data["changes"] if c["type"] == "spelling"]
         assert len(spelling_changes) >= 1
         assert any(c["replacement"] == "colour" for c in spelling_changes)
+
+
+# ------------------------------------------------------------------ #
+# 9. Streaming endpoint
+# ------------------------------------------------------------------ #
+
+
+class TestStreaming:
+    def test_stream_yields_one_chunk_per_sentence(self):
+        text = "I like the color. She is traveling to the center."
+        resp = client.post("/correct/stream", json={"text": text, "variant": "uk"})
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("application/x-ndjson")
+        chunks = [json.loads(line) for line in resp.text.splitlines()]
+        assert len(chunks) == 2
+        corrected = "".join(c["corrected"] for c in chunks).lower()
+        assert "colour" in corrected
+        assert "travelling" in corrected
+        assert "centre" in corrected
+
+    def test_stream_empty_string(self):
+        resp = client.post("/correct/stream", json={"text": "", "variant": "us"})
+        assert resp.status_code == 422
+
+
+# ------------------------------------------------------------------ #
+# 10. OpenAPI document
+# ------------------------------------------------------------------ #
+
+
+class TestOpenAPI:
+    def test_correct_schemas_published(self):
+        schema = client.get("/openapi.json").json()
+        post = schema["paths"]["/correct"]["post"]
+        body = post["requestBody"]["content"]["application/json"]["schema"]
+        assert body == {"$ref": "#/components/schemas/CorrectionRequest"}
+        ok = post["responses"]["200"]["content"]["application/json"]["schema"]
+        assert ok == {"$ref": "#/components/schemas/CorrectionResponse"}
+        components = schema["components"]["schemas"]
+        assert components["CorrectionRequest"]["required"] == ["text", "variant"]
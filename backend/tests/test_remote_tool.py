@@ -0,0 +1,126 @@
+import time
+import urllib.parse
+
+import httpx
+import pytest
+from language_tool_python.utils import LanguageToolError
+
+from app.corrector import TextCorrector, _RemoteLanguageTool
+
+_URL = "http://languagetool:8010"
+
+
+def _tool(handler) -> _RemoteLanguageTool:
+    return _RemoteLanguageTool(_URL, "en-US", transport=httpx.MockTransport(handler))
+
+
+def _check_response(offset: int, length: int) -> dict:
+    return {
+        "matches": [
+            {
+                "message": "Possible typo.",
+                "replacements": [{"value": "the"}],
+                "offset": offset,
+                "length": length,
+                "context": {"text": "...", "offset": 0, "length": length},
+                "rule": {
+                    "id": "MORFOLOGIK_RULE_EN_US",
+                    "issueType": "misspelling",
+                    "category": {"id": "TYPOS"},
+                },
+            }
+        ]
+    }
+
+
+# ------------------------------------------------------------------ #
+# 1. check
+# ------------------------------------------------------------------ #
+
+
+class TestCheck:
+    def test_builds_matches(self):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=_check_response(4, 3))
+
+        (match,) = _tool(handler).check("See teh cat.")
+        assert (match.offset, match.errorLength) == (4, 3)
+        assert match.replacements == ["the"]
+        assert match.ruleId == "MORFOLOGIK_RULE_EN_US"
+
+        (request,) = requests
+        assert request.url == f"{_URL}/v2/check"
+        form = urllib.parse.parse_qs(request.content.decode())
+        assert form == {"language": ["en-US"], "text": ["See teh cat."]}
+
+    def test_converts_utf16_offset_after_emoji(self):
+        text = "\U0001f600 See teh cat."
+        # LanguageTool counts the emoji as two UTF-16 units
+        handler = lambda request: httpx.Response(200, json=_check_response(7, 3))
+        (match,) = _tool(handler).check(text)
+        assert text[match.offset : match.offset + match.errorLength] == "teh"
+
+    def test_server_error_is_wrapped(self):
+        handler = lambda request: httpx.Response(500, text="boom")
+        with pytest.raises(LanguageToolError, match="languagetool:8010"):
+            _tool(handler).check("text")
+
+    def test_connect_error_is_wrapped(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        with pytest.raises(LanguageToolError, match="refused"):
+            _tool(handler).check("text")
+
+
+# ------------------------------------------------------------------ #
+# 2. wait_ready
+# ------------------------------------------------------------------ #
+
+
+class TestWaitReady:
+    def test_retries_until_up(self):
+        attempts: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request.url.path)
+            if len(attempts) < 3:
+                raise httpx.ConnectError("refused", request=request)
+            return httpx.Response(200, json=[])
+
+        _tool(handler).wait_ready(timeout=5, interval=0)
+        assert attempts == ["/v2/languages"] * 3
+
+    def test_raises_at_deadline(self):
+        attempts = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal attempts
+            attempts += 1
+            return httpx.Response(503)
+
+        started = time.monotonic()
+        with pytest.raises(LanguageToolError, match="not ready"):
+            _tool(handler).wait_ready(timeout=0.2, interval=0.05)
+        assert time.monotonic() - started >= 0.2
+        assert attempts > 1
+
+
+# ------------------------------------------------------------------ #
+# 3. Server selection
+# ------------------------------------------------------------------ #
+
+
+class TestServerSelection:
+    def test_languagetool_url_uses_remote_server(self, monkeypatch):
+        def local_server(*args, **kwargs):
+            raise AssertionError("local server started")
+
+        monkeypatch.setenv("LANGUAGETOOL_URL", _URL)
+        monkeypatch.setattr("language_tool_python.LanguageTool", local_server)
+        corrector = TextCorrector()
+        assert isinstance(corrector._tool, _RemoteLanguageTool)
+        assert corrector._tool._client.base_url == _URL